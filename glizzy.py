@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 import argparse
-import random
+import array
+import bisect
+import itertools
+import os
 import subprocess
-import shlex
 import json
+import operator
+import queue
 import re
 import sys
+import threading
 import time
-from collections import defaultdict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import curses for TUI
 try:
@@ -36,6 +42,34 @@ PROPERTY_FLAGS = {
     0x80: "Extended Properties"
 }
 
+# property byte → "Read, Write, ..." for every possible value
+_PROP_STRS = [", ".join(n for b,n in PROPERTY_FLAGS.items() if v & b) or "None" for v in range(256)]
+
+# -s/-H argument: a handle or handle range
+_RANGE_RE = re.compile(r"(?:0[xX])?([0-9a-fA-F]+)(?:-(?:0[xX])?([0-9a-fA-F]+))?")
+
+# gatttool output parsers
+_SVC_RE  = re.compile(r"attr handle: (0x[0-9a-f]+), end grp handle: (0x[0-9a-f]+) uuid: ([0-9a-fA-F-]+)")
+_CHAR_RE = re.compile(r"handle: (0x[0-9a-f]+), char properties: (0x[0-9a-f]+), char value handle: (0x[0-9a-f]+), uuid: ([0-9a-fA-F-]+)")
+
+# gatttool -I session: lines that end a command exchange, async notifications, and
+# the readline noise (colors, "[MAC][LE]> " prompt) wrapped around every reply
+_CONNECT_RE = re.compile(rb"Connection successful|Error|Failed")
+_REPLY_RE   = re.compile(rb"written successfully|value/descriptor|Error|Failed|Invalid|Disconnected")
+_NOTE_RE    = re.compile(rb"(?:Notification|Indication) +handle")
+_LIST_RE    = re.compile(rb"handle: 0x")
+_FAILED_RE  = re.compile(rb"failed|Failed|Error|Disconnected")
+_ANSI_RE    = re.compile(rb"\x1b\[[0-9;]*[A-Za-z]")
+_PROMPT_RE  = re.compile(rb"\[[0-9A-Fa-f:]{17}\](?:\[LE\])?> |\r")
+
+CONNECT_TIMEOUT = 10    # seconds to wait for the session to connect
+REPLY_TIMEOUT   = 5     # seconds to wait for a command reply
+NOTIFY_TIMEOUT  = 5     # seconds to listen for a notification after a write
+PIPELINE_DEPTH  = 8     # probes queued ahead of the session worker
+DISCOVER_TIMEOUT = 30   # seconds to wait for a discovery listing
+QUIET_TIME      = 1     # seconds of silence that end a discovery listing
+LOG_BATCH       = 64    # most log lines written per flush
+
 class BLEFuzzer:
     def __init__(self, args):
         # Required
@@ -57,33 +91,82 @@ class BLEFuzzer:
         # Modes
         self.read_only       = args.read_only
         self.notify_mode     = args.notify
+        self.only_writable   = args.only_writable
         self.use_tui         = args.tui and curses is not None
 
         # Logging
         self.logfile         = args.log
         self.logstream       = open(self.logfile, 'w') if self.logfile else None
+        self._jsonl          = open('glizzy_results.jsonl', 'w', buffering=1)   # one result dict per line, flushed as written
+        self._logq           = queue.Queue()
+        self._log_thread     = threading.Thread(target=self._log_drain, daemon=True)
+        self._log_thread.start()
 
         # Internal state
         self.services        = []      # list of dicts {start,end,uuid}
-        self.results         = []      # list of result dicts
         self.start_time      = None
         self.success_count   = 0
         self.fail_count      = 0
+        self._total          = 0       # probes planned for this run
+        self._notify_handles = None    # value handles with Notify/Indicate; None = unknown
+        self._unwritable     = None    # declarations + value handles without write bits; None = unknown
+        self._all_handles    = array.array('H')   # every handle to fuzz, in order
+        self._svc_marks      = {}      # position in _all_handles -> service header
+        self._hstrs          = []      # "0x%04x" of each entry in _all_handles
+        self._lock           = threading.Lock()
+        # non-random payloads depend only on length: build each one once
+        self._fixed_payloads = [self.prefix + '0'*max(L - len(self.prefix), 0) for L in range(self.chars_to_write+1)]
+
+        # Persistent gatttool -I session, connected on first use
+        self._gt_argv        = ('gatttool','-I','-t',self.le_address_type,'-b',self.mac_address)
+        self._gt             = None    # gatttool process
+        self._gtq            = None    # its stdout lines, fed by _pump
+        self._gt_eof         = False   # _pump saw EOF: the process is gone even if not yet reaped
+        self._connected      = False
+        self._notes          = []      # notifications seen mid-exchange
 
     def _log(self, msg):
-        print(msg)
-        if self.logstream:
-            self.logstream.write(msg + "\n")
-            self.logstream.flush()
+        self._logq.put(msg)
+
+    def _log_drain(self):
+        """Write queued log lines in batches; a None in the queue ends the thread."""
+        while True:
+            batch = [self._logq.get()]
+            while batch[-1] is not None and len(batch) < LOG_BATCH:
+                try:
+                    batch.append(self._logq.get(timeout=0.05))
+                except queue.Empty:
+                    break
+            done = batch[-1] is None
+            if done:
+                batch.pop()
+            if batch:
+                text = "\n".join(batch) + "\n"
+                sys.stdout.write(text)
+                sys.stdout.flush()
+                if self.logstream:
+                    self.logstream.write(text)
+                    self.logstream.flush()
+            if done:
+                return
+
+    @staticmethod
+    def _rand_hex(n):
+        if n <= 0:
+            return ''
+        return os.urandom((n+1)//2).hex()[:n]
 
     @staticmethod
     def parse_hex_range(s):
-        parts = s.split('-')
-        if len(parts) == 1:
-            v = int(parts[0], 16)
-            return [(v, v)]
-        a, b = int(parts[0], 16), int(parts[1], 16)
-        return [(a, b)]
+        """argparse type for a handle or handle range ("0x0003", "0x0007-0x000a") → (start, end)."""
+        m = _RANGE_RE.fullmatch(s.strip())
+        if not m:
+            raise argparse.ArgumentTypeError(f"invalid hex range '{s}' (expected e.g. 0x0003 or 0x0007-0x000a)")
+        a = int(m.group(1), 16)
+        b = int(m.group(2), 16) if m.group(2) else a
+        if a > b or b > 0xFFFF:
+            raise argparse.ArgumentTypeError(f"invalid hex range '{s}' (need start <= end <= 0xffff)")
+        return (a, b)
 
     def discover(self):
         """Discover primary services and then characteristic descriptors with plain-English properties."""
@@ -95,26 +178,18 @@ class BLEFuzzer:
             self.services = [{'start':a,'end':b,'uuid':'manual'} for a,b in self.service_ranges]
         else:
             # default: primary services
-            cmd = f"gatttool --addr-type={self.le_address_type} --primary --device={self.mac_address}"
-            try:
-                out = subprocess.check_output(shlex.split(cmd), stderr=subprocess.DEVNULL)
-                text = out.decode('utf-8','ignore')
-                self._log(text.strip())
-                for line in text.splitlines():
-                    m = re.search(
-                        r"attr handle = (0x[0-9a-f]+), end grp handle = (0x[0-9a-f]+) uuid: ([0-9a-fA-F-]+)",
-                        line
-                    )
-                    if m:
-                        s, e, u = m.groups()
-                        self.services.append({
-                            'start': int(s,16),
-                            'end':   int(e,16),
-                            'uuid':  u.lower()
-                        })
-            except subprocess.CalledProcessError:
+            text = self._query('primary')
+            if text is None:
                 self._log(f"{YELLOW}[!] Could not discover primary services{RESET}")
                 sys.exit(1)
+            self._log(text)
+            for m in _SVC_RE.finditer(text):
+                s, e, u = m.groups()
+                self.services.append({
+                    'start': int(s,16),
+                    'end':   int(e,16),
+                    'uuid':  u.lower()
+                })
 
         # Filter by UUID prefix
         if self.target_uuid:
@@ -126,75 +201,300 @@ class BLEFuzzer:
 
         # Now discover characteristic descriptors
         self._log(f"{MAGENTA}==> CHARACTERISTIC DESCRIPTORS{RESET}")
-        char_cmd = (
-            f"gatttool --addr-type={self.le_address_type} "
-            f"--device={self.mac_address} --char-desc"
-        )
-        try:
-            crou = subprocess.check_output(shlex.split(char_cmd), stderr=subprocess.DEVNULL)
-            ctext = crou.decode('utf-8','ignore')
-            for line in ctext.splitlines():
-                m2 = re.search(
-                    r"handle: (0x[0-9a-f]+), char properties: (0x[0-9a-f]+), char value handle: (0x[0-9a-f]+), uuid: ([0-9a-fA-F-]+)",
-                    line
-                )
-                if not m2:
-                    continue
+        ctext = self._query('characteristics')
+        if ctext is None:
+            self._log(f"{YELLOW}[!] Could not discover characteristics{RESET}")
+        else:
+            self._notify_handles = set()
+            self._unwritable     = set()
+            # sorted range starts + running max of ends, so one bisect answers
+            # "is h inside any service range" even for overlapping manual ranges
+            svcs = sorted(self.services, key=lambda s: s['start'])
+            _starts = array.array('I', [s['start'] for s in svcs])
+            _ends   = array.array('I')
+            top = 0
+            for s in svcs:
+                top = max(top, s['end'])
+                _ends.append(top)
+            for m2 in _CHAR_RE.finditer(ctext):
                 handle_hex, prop_hex, val_handle, uuid = m2.groups()
                 h = int(handle_hex,16)
+                prop_val = int(prop_hex,16)
+                # recorded before the range check: a -H/-s range often holds the value
+                # handle but not its declaration one below it
+                if prop_val & 0x30:
+                    self._notify_handles.add(int(val_handle,16))
+                # a declaration is never writable, nor is a value without Write/Write w/o response;
+                # descriptors (CCCDs etc.) carry no property bits and are left to the sweep
+                self._unwritable.add(h)
+                if not prop_val & 0x0C:
+                    self._unwritable.add(int(val_handle,16))
                 # only if within any discovered service range
-                if not any(s['start'] <= h <= s['end'] for s in self.services):
+                i = bisect.bisect_right(_starts, h) - 1
+                if i < 0 or h > _ends[i]:
                     continue
-                prop_val = int(prop_hex,16)
-                # decode bits
-                names = [name for bit,name in PROPERTY_FLAGS.items() if prop_val & bit]
-                names_str = ", ".join(names) if names else "None"
+                names_str = _PROP_STRS[prop_val & 0xff]
                 self._log(f"{CYAN}{handle_hex}{RESET}: Properties [{names_str}], Value Handle={val_handle}, UUID={uuid}")
-        except subprocess.CalledProcessError:
-            self._log(f"{YELLOW}[!] Could not discover characteristics{RESET}")
+
+        # flatten the service ranges into one handle array for fuzzing; _svc_marks maps
+        # the position where each range begins to its section header
+        # explicit -H handles are fuzzed as given; so is everything when reading only
+        prune = self.only_writable and not self.handle_ranges and not self.read_only
+        unwritable = self._unwritable if prune else None
+        self._all_handles = array.array('H')
+        self._svc_marks   = {}
+        skipped = 0
+        for svc in self.services:
+            a,b,u = svc['start'],svc['end'],svc['uuid']
+            hs = range(a, b+1) if unwritable is None else [h for h in range(a, b+1) if h not in unwritable]
+            skipped += b - a + 1 - len(hs)
+            if not hs:
+                continue
+            sep = "\n" if self._svc_marks else ""
+            self._svc_marks[len(self._all_handles)] = f"{sep}{CYAN}Service {hex(a)}–{hex(b)} (UUID:{u}){RESET}"
+            self._all_handles.extend(hs)
+        self._hstrs = [f"0x{h:04x}" for h in self._all_handles]
+        if skipped:
+            self._log(f"{GRAY}Skipping {skipped} characteristic declaration/read-only value handle(s) (use --brute-all to fuzz them){RESET}")
+
+    @staticmethod
+    def _pump(stream, q):
+        for line in iter(stream.readline, b''):
+            q.put(line)
+        q.put(None)    # EOF: gatttool exited
+
+    @staticmethod
+    def _clean(line):
+        # colors first: the connected prompt has one between "[MAC]" and "[LE]> "
+        line = _PROMPT_RE.sub(b'', _ANSI_RE.sub(b'', line))
+        return line.decode('utf-8','ignore').strip()
+
+    def _connect(self):
+        """(Re)start the gatttool -I session if needed and connect it to the device."""
+        if self._gt is None or self._gt_eof or self._gt.poll() is not None:
+            if self._gt is not None and self._gt.poll() is None:
+                self._gt.kill()
+                self._gt.wait()
+            self._gt_eof = False
+            self._gt = subprocess.Popen(
+                self._gt_argv,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            self._gtq = queue.Queue()
+            threading.Thread(target=self._pump, args=(self._gt.stdout, self._gtq), daemon=True).start()
+        out = self._exchange('connect', _CONNECT_RE, CONNECT_TIMEOUT)
+        self._connected = b"Connection successful" in out
+        if not self._connected:
+            if not _CONNECT_RE.search(out):
+                self._abandon()
+            self._log(f"{YELLOW}[!] Could not connect to {self.mac_address}{RESET}")
+        return self._connected
+
+    def _abandon(self):
+        """Kill a session that stopped answering so the next command respawns it; a
+        late reply can then never be credited to a later probe."""
+        if self._gt is not None and self._gt.poll() is None:
+            self._gt.kill()
+            self._gt.wait()
+        self._gt_eof = True
+        self._connected = False
+
+    def close(self):
+        """Shut down the gatttool session and flush any pending log output."""
+        if self._gt is not None and self._gt.poll() is None:
+            try:
+                if not self._gt_eof:
+                    self._gt.stdin.write(b"exit\n")
+                    self._gt.stdin.flush()
+                self._gt.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self._gt.kill()
+        if self._log_thread.is_alive():
+            self._logq.put(None)
+            self._log_thread.join()
+
+    def _get_line(self, deadline):
+        """Next line of session output, or None on timeout / session exit."""
+        left = deadline - time.monotonic()
+        if left <= 0:
+            return None
+        try:
+            line = self._gtq.get(timeout=left)
+        except queue.Empty:
+            return None
+        if line is None:
+            self._gt_eof = True
+            self._connected = False
+        return line
+
+    def _drain(self):
+        """Drop stale output from a previous exchange (late replies), keeping notifications
+        and noting whether the session has exited."""
+        while True:
+            try:
+                line = self._gtq.get_nowait()
+            except queue.Empty:
+                return
+            if line is None:
+                self._gt_eof = True
+                self._connected = False
+            elif _NOTE_RE.search(line):
+                self._notes.append(line)
+
+    def _exchange(self, cmd, until, timeout, listing=None):
+        """Write one command and collect its output up to the line matching `until`.
+        Commands with no closing line pass `listing`: the output then ends QUIET_TIME
+        after the last line matching it."""
+        self._drain()
+        if self._gt_eof:
+            return b''
+        try:
+            self._gt.stdin.write(cmd.encode() + b"\n")
+            self._gt.stdin.flush()
+        except OSError:
+            self._connected = False
+            return b''
+
+        block = []
+        deadline = end = time.monotonic() + timeout
+        while True:
+            line = self._get_line(end)
+            if line is None:
+                break
+            if _NOTE_RE.search(line):
+                self._notes.append(line)
+                continue
+            block.append(line)
+            if until.search(line):
+                break
+            if listing is not None and listing.search(line):
+                end = min(deadline, time.monotonic() + QUIET_TIME)
+        return b''.join(block)
+
+    def _send(self, cmd):
+        """Run a command on the session, reconnecting first if the link was lost."""
+        if self._gtq is not None:
+            self._drain()    # notice a session that died since the last command
+        if not self._connected and not self._connect():
+            return b''
+        out = self._exchange(cmd, _REPLY_RE, REPLY_TIMEOUT)
+        if not _REPLY_RE.search(out):
+            # no reply: gatttool may still think it is connected (and ignore 'connect'),
+            # and the reply may yet turn up mid-exchange, so start over with a new session
+            self._abandon()
+        elif b"Disconnected" in out:
+            self._connected = False
+        return out
+
+    def _query(self, cmd):
+        """Run a discovery command on the session; its listing as plain text, or None on failure."""
+        if self._gtq is not None:
+            self._drain()    # notice a session that died since the last command
+        if not self._connected and not self._connect():
+            return None
+        out = self._exchange(cmd, _FAILED_RE, DISCOVER_TIMEOUT, listing=_LIST_RE)
+        if _FAILED_RE.search(out):
+            return None
+        lines = (self._clean(l) for l in out.splitlines())
+        return "\n".join(l for l in lines if l and l != cmd)
+
+    def _reply(self, block):
+        """The reply line of an exchange as plain text ('' if none arrived)."""
+        lines = block.splitlines()
+        if not lines or not _REPLY_RE.search(lines[-1]):
+            return ''
+        return self._clean(lines[-1])
+
+    def _listen(self, timeout):
+        """Notifications received so far, waiting up to `timeout` if there are none yet."""
+        deadline = time.monotonic() + timeout
+        while not self._notes and self._connected:
+            line = self._get_line(deadline)
+            if line is None:
+                break
+            if _NOTE_RE.search(line):
+                self._notes.append(line)
+        notes, self._notes = self._notes, []
+        return [self._clean(n) for n in notes]
 
     def _read_handle(self, hstr):
-        cmd = f"gatttool --addr-type={self.le_address_type} --device={self.mac_address} --char-read --handle={hstr}"
-        rp = subprocess.Popen(shlex.split(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        out,_ = rp.communicate()
-        return out.decode('utf-8','ignore').strip()
-
-    def _attempt(self, hstr, length, payload):
-        write_cmd = (
-            f"gatttool --addr-type={self.le_address_type} "
-            f"--device={self.mac_address} --char-write-req "
-            f"--handle={hstr} --value={payload}"
-        )
-        wp = subprocess.Popen(shlex.split(write_cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        wout,werr = wp.communicate()
-        code = wp.returncode
-        resp = (wout+werr).decode('utf-8','ignore').strip()
-
-        success = (code==0 and "was written successfully" in resp)
+        return self._reply(self._send(f"char-read-hnd {hstr}"))
+
+    def _attempt(self, hstr, length, payload, tag=None, h=None):
+        if tag is None:
+            tag = f"{CYAN}{hstr}{RESET} len={length:<3}"
+        out  = self._send(f"char-write-req {hstr} {payload}")
+
+        # match raw bytes; the reply is only decoded when a failure gets logged
+        success = b"was written successfully" in out
         if success:
             rb = self._read_handle(hstr)
-            self.results.append({'handle':hstr,'length':length,'exit':0,'readback':rb})
-            self.success_count += 1
-            self._log(f"{GREEN}✔{RESET} {CYAN}{hstr}{RESET} len={length:<3} input=0x{payload} -> {GREEN}OK{RESET} readback={CYAN}{rb}{RESET}")
+            with self._lock:
+                self._jsonl.write(json.dumps({'handle':hstr,'length':length,'exit':0,'readback':rb}) + "\n")
+                self.success_count += 1
+            self._log(f"{GREEN}✔{RESET} {tag} input=0x{payload} -> {GREEN}OK{RESET} readback={CYAN}{rb}{RESET}")
         else:
+            resp = self._reply(out) or "No reply"
             mark = '?' if "invalid" in resp.lower() else '✖'
             color = YELLOW if mark=='?' else RED
-            self.results.append({'handle':hstr,'length':length,'exit':code,'readback':None})
-            self.fail_count += 1
-            self._log(f"{color}{mark}{RESET} {CYAN}{hstr}{RESET} len={length:<3} input=0x{payload} -> {resp}")
+            with self._lock:
+                self._jsonl.write(json.dumps({'handle':hstr,'length':length,'exit':1,'readback':None}) + "\n")
+                self.fail_count += 1
+            self._log(f"{color}{mark}{RESET} {tag} input=0x{payload} -> {resp}")
 
+        # only wait on handles that can actually notify/indicate
         if self.notify_mode:
-            try:
-                out = subprocess.check_output(
-                    f"timeout 5 gatttool --device={self.mac_address} "
-                    f"--addr-type={self.le_address_type} --listen",
-                    shell=True, stderr=subprocess.DEVNULL
-                )
-                note = out.decode('utf-8','ignore').strip()
-                if note:
+            if h is None:
+                h = int(hstr,16)
+            if self._notify_handles is None or h in self._notify_handles:
+                for note in self._listen(NOTIFY_TIMEOUT):
                     self._log(f"{YELLOW}🔔 Notify: {note}{RESET}")
-            except subprocess.CalledProcessError:
-                pass
+        return success
+
+    def _work(self, marks=None):
+        """Yield (hstr, length, payload, tag, h, header) for every probe against
+        _all_handles.  tag is the colored "handle len=N" log prefix, shared while length
+        is fixed; header is set from `marks` on the first probe of each service range."""
+        lengths = [self.chars_to_write]*self.runs if self.runs else range(1,self.chars_to_write+1)
+        for i, (h, hstr) in enumerate(zip(self._all_handles, self._hstrs)):
+            tag    = f"{CYAN}{hstr}{RESET} len={self.chars_to_write:<3}" if self.runs else None
+            header = marks.get(i) if marks else None
+            for length in lengths:
+                if self.random_mode:
+                    payload = self.prefix + self._rand_hex(length - len(self.prefix))
+                else:
+                    payload = self._fixed_payloads[length]
+                yield hstr, length, payload, tag or f"{CYAN}{hstr}{RESET} len={length:<3}", h, header
+                header = None
+
+    def _probe(self, hstr, length, payload, tag, h, header):
+        # headers are logged here so they stay in order with the probes' own output
+        if header is not None:
+            self._log(header)
+        # --delay spaces probe starts; time spent on the link already counts toward it
+        deadline = time.monotonic() + self.delay
+        success = self._attempt(hstr, length, payload, tag, h)
+        dt = deadline - time.monotonic()
+        if dt > 0:
+            time.sleep(dt)
+        return hstr, length, success
+
+    def _pipeline(self, work):
+        """Run probes on the session worker, keeping a few queued ahead of it so payload
+        generation and status updates overlap the BLE round-trip.  Yields
+        (hstr, length, success) for each probe in submission order."""
+        # one worker: the link carries a single outstanding ATT request
+        pool = ThreadPoolExecutor(max_workers=1)
+        inflight = deque()
+        try:
+            for item in work:
+                inflight.append(pool.submit(self._probe, *item))
+                if len(inflight) >= PIPELINE_DEPTH:
+                    yield inflight.popleft().result()
+            while inflight:
+                yield inflight.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def _curses_fuzz(self, stdscr):
         curses.curs_set(0)
@@ -212,29 +512,19 @@ class BLEFuzzer:
         row += 1
         status_row = row
 
-        for svc in self.services:
-            for h in range(svc['start'], svc['end']+1):
-                for length in ([self.chars_to_write]*self.runs if self.runs else range(1,self.chars_to_write+1)):
-                    suffix_len = length - len(self.prefix)
-                    suffix = ''.join(random.choice('0123456789abcdef') for _ in range(suffix_len)) if self.random_mode else '0'*suffix_len
-                    payload = self.prefix + suffix
-
-                    success_before = self.success_count
-                    self._attempt(f"0x{h:04x}", length, payload)
-                    success = self.success_count > success_before
-
-                    elapsed = int(time.time() - self.start_time)
-                    stdscr.addstr(status_row,2,
-                        f"H:0x{h:04x} L:{length:<3} S:{self.success_count:<4} F:{self.fail_count:<4} E:{elapsed}s",
-                        curses.A_REVERSE if not success else curses.A_NORMAL
-                    )
-                    stdscr.clrtoeol()
-                    stdscr.refresh()
-                    time.sleep(self.delay)
-
-                    c = stdscr.getch()
-                    if c in (ord('q'), ord('Q')):
-                        return
+        for hstr, length, success in self._pipeline(self._work()):
+            elapsed = int(time.time() - self.start_time)
+            done = self.success_count + self.fail_count
+            stdscr.addstr(status_row,2,
+                f"H:{hstr} L:{length:<3} S:{self.success_count:<4} F:{self.fail_count:<4} N:{done}/{self._total} E:{elapsed}s",
+                curses.A_REVERSE if not success else curses.A_NORMAL
+            )
+            stdscr.clrtoeol()
+            stdscr.refresh()
+
+            c = stdscr.getch()
+            if c in (ord('q'), ord('Q')):
+                return
 
         stdscr.nodelay(False)
         stdscr.addstr(status_row+2,2,"Fuzz complete. Press any key.",curses.A_BOLD)
@@ -251,45 +541,53 @@ class BLEFuzzer:
                 for h in range(a,b+1):
                     hstr = f"0x{h:04x}"
                     val  = self._read_handle(hstr)
-                    self.results.append({'handle':hstr,'readback':val})
+                    self._jsonl.write(json.dumps({'handle':hstr,'readback':val}) + "\n")
                     self._log(f"{GREEN}✔{RESET} {CYAN}{hstr}{RESET} -> {CYAN}{val}{RESET}")
             return
 
+        # probe count is known upfront: every handle gets runs (or chars) writes
+        self._total = len(self._all_handles) * (self.runs or self.chars_to_write)
+
         if self.use_tui:
             curses.wrapper(self._curses_fuzz)
             return
 
         self._log(f"{MAGENTA}==> FUZZING HANDLES{RESET}\n")
-        for svc in self.services:
-            a,b,u = svc['start'],svc['end'],svc['uuid']
-            self._log(f"{CYAN}Service {hex(a)}–{hex(b)} (UUID:{u}){RESET}")
-            for h in range(a,b+1):
-                hstr = f"0x{h:04x}"
-                if self.runs:
-                    for _ in range(self.runs):
-                        length = self.chars_to_write
-                        suffix_len = length - len(self.prefix)
-                        suffix = ''.join(random.choice('0123456789abcdef') for _ in range(suffix_len)) if self.random_mode else '0'*suffix_len
-                        self._attempt(hstr, length, self.prefix + suffix)
-                        time.sleep(self.delay)
-                else:
-                    for length in range(1,self.chars_to_write+1):
-                        suffix_len = length - len(self.prefix)
-                        suffix = ''.join(random.choice('0123456789abcdef') for _ in range(suffix_len)) if self.random_mode else '0'*suffix_len
-                        self._attempt(hstr, length, self.prefix + suffix)
-                        time.sleep(self.delay)
-            self._log("")
+        for _ in self._pipeline(self._work(self._svc_marks)):
+            pass
+        self._log("")
 
     def summarize(self):
-        with open('glizzy_results.json','w') as f:
-            json.dump(self.results, f, indent=2)
+        self._jsonl.close()
+        # re-emit the streamed lines as the JSON array glizzy_results.json has always held
+        with open('glizzy_results.jsonl') as src, open('glizzy_results.json','w') as f:
+            sep = "[\n  "
+            for line in src:
+                f.write(sep + line.rstrip("\n"))
+                sep = ",\n  "
+            f.write("\n]\n" if sep != "[\n  " else "[]\n")
         self._log(f"{MAGENTA}==> RESULTS SAVED{RESET}")
 
+        # per-handle summary: all probes of a handle are consecutive in the stream, so
+        # groupby sees each handle in one pass without sorting or an aggregate dict
+        with open('glizzy_results.jsonl') as src:
+            rows = (e for e in map(json.loads, src) if 'length' in e)
+            for i, (h, grp) in enumerate(itertools.groupby(rows, key=operator.itemgetter('handle'))):
+                max_ok, first_fail = 0, None
+                for e in grp:
+                    if e['exit'] == 0:
+                        max_ok, first_fail = max(max_ok, e['length']), None
+                    elif first_fail is None:
+                        first_fail = e['length']
+                if i == 0:
+                    self._log(f"\n{MAGENTA}==> SUMMARY{RESET}")
+                self._log(f"{h}: max {max_ok} bytes, fail at {first_fail}")
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='GLIZZY — BLE GATT Handle Fuzzer / Reader')
     parser.add_argument('mac', help='BLE device MAC address')
-    parser.add_argument('-s','--services', action='append', help='Service ranges (e.g. 0x1-0x9)')
-    parser.add_argument('-H','--handles', action='append', help='Explicit handles (e.g. 0x0003 or 0x0007-0x000a)')
+    parser.add_argument('-s','--services', action='append', type=BLEFuzzer.parse_hex_range, help='Service ranges (e.g. 0x1-0x9)')
+    parser.add_argument('-H','--handles', action='append', type=BLEFuzzer.parse_hex_range, help='Explicit handles (e.g. 0x0003 or 0x0007-0x000a)')
     parser.add_argument('-u','--uuid', help='Filter services by UUID prefix')
     parser.add_argument('-c','--chars', type=int, default=10, help='Max payload length for incremental mode')
     parser.add_argument('-n','--runs', type=int, help='Number of static-length writes')
@@ -300,22 +598,20 @@ if __name__ == '__main__':
     parser.add_argument('--read-only', action='store_true', help='Only read current values, no fuzz')
     parser.add_argument('--delay', type=float, help='Delay between operations (seconds)')
     parser.add_argument('--notify', action='store_true', help='Listen for notifications after writes')
+    parser.add_argument('--only-writable', dest='only_writable', action='store_true', default=True, help='Skip characteristic declarations and value handles whose properties forbid writes (default)')
+    parser.add_argument('--brute-all', dest='only_writable', action='store_false', help='Fuzz every handle in range, writable or not')
     parser.add_argument('--tui', action='store_true', help='Enable curses TUI dashboard')
     args = parser.parse_args()
 
-    # Expand hex ranges
-    if args.services:
-        args.services = [rng for r in args.services for rng in BLEFuzzer.parse_hex_range(r)]
-    if args.handles:
-        args.handles = [rng for r in args.handles for rng in BLEFuzzer.parse_hex_range(r)]
-
     fuzzer = BLEFuzzer(args)
     try:
         fuzzer.discover()
         fuzzer.fuzz()
         fuzzer.summarize()
     except KeyboardInterrupt:
-        print(f"\n{YELLOW}==> INTERRUPTED{RESET}")
+        fuzzer._log(f"\n{YELLOW}==> INTERRUPTED{RESET}")
         fuzzer.summarize()
         sys.exit(1)
+    finally:
+        fuzzer.close()
 